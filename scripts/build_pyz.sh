@@ -0,0 +1,24 @@
+#!/usr/bin/env sh
+# Build a precompiled zipapp so cold starts skip source compilation.
+set -eu
+
+BUILD_DIR="build/pyz"
+OUT="dist/rca.pyz"
+
+rm -rf "$BUILD_DIR"
+mkdir -p "$BUILD_DIR" dist
+
+cp -r src "$BUILD_DIR/src"
+
+# Compile ahead of time (-b writes .pyc next to each .py, -o 2 strips
+# docstrings/asserts), then drop the sources so only bytecode ships.
+python -m compileall -q -b -o 2 "$BUILD_DIR/src"
+find "$BUILD_DIR/src" -name "*.py" -delete
+find "$BUILD_DIR/src" -name "__pycache__" -type d -prune -exec rm -rf {} +
+
+python -m zipapp "$BUILD_DIR" \
+    -m "src.main:main_entry" \
+    -o "$OUT" \
+    -p "/usr/bin/env python3"
+
+echo "Built $OUT"
@@ -3,32 +3,53 @@
 from __future__ import annotations
 
 import logging
-from typing import Annotated
 
-import typer
 
-from src.utils.logging import SetLogger
-
-logger = SetLogger().logger
+def setup_logging() -> None:
+    """Set up logging level."""
+    from src.utils.logging import SetLogger  # noqa: PLC0415
 
-app = typer.Typer()
+    set_logger = SetLogger()
+    set_logger.redirect_stderr()
 
+    logger = set_logger.logger
+    # Already verbose; nothing to update
+    if logger.level == logging.DEBUG:
+        return
 
-def setup_logging() -> None:
-    """Set up logging level."""
     logger.setLevel(logging.DEBUG)
 
-    for handler in logger.handlers:
+    handlers = logger.handlers
+
+    for handler in handlers:
         handler.setLevel(logging.DEBUG)
 
-    logger.info("Updated logger level to: DEBUG")
+    logger.debug("Updated logger level to: DEBUG")
 
 
-@app.command()
 def main(
     *,
-    verbose: Annotated[bool, typer.Option(help="Verbose mode")] = False,
+    verbose: bool = False,
 ) -> None:
     """Recieve meta data for analytics."""
     if verbose:
         setup_logging()
+
+
+def main_entry() -> None:
+    """Console script entry point."""
+    import argparse  # noqa: PLC0415
+
+    parser = argparse.ArgumentParser(
+        description="Recieve meta data for analytics"
+    )
+
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Verbose mode",
+    )
+
+    args = parser.parse_args()
+
+    main(verbose=args.verbose)
@@ -2,38 +2,50 @@
 
 from __future__ import annotations
 
-import argparse
-from configparser import ConfigParser
+import os
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from typing import Any
 
-def parse_args() -> argparse.ArgumentParser.parse_args:
-    """Parse arguments."""
-    parser = argparse.ArgumentParser(description="Load configuration file")
+# Parsed configs keyed by path; the stat key invalidates on any rewrite.
+_CONFIG_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
 
-    parser.add_argument(
-        "--config",
-        type=str,
-        default="config.ini",
-        help="Path to the configuration file",
-    )
 
-    return parser.parse_args()
+def read_config(path: str) -> dict[str, Any]:
+    """Read config.toml file, reusing the parse while the file is unchanged."""
+    from pathlib import Path  # noqa: PLC0415
 
+    st = Path(path).stat()
+    key = (st.st_mtime_ns, st.st_size)
 
-def read_config(path: str) -> None:
-    """Read config.ini file with typer."""
-    config = ConfigParser()
-    config.read(path)
-    config.sections()
+    cached = _CONFIG_CACHE.get(path)
 
-    return config
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    import tomllib  # noqa: PLC0415
+
+    # One read syscall for the whole file, then a single parse
+    data = tomllib.loads(Path(path).read_text(encoding="utf-8"))
+
+    _CONFIG_CACHE[path] = (key, data)
+
+    return data
 
 
 class Config:
-    """Config load."""
+    """Config load.
+
+    Args:
+        config_path(str|None): Path to the configuration file. Defaults
+                                to the CONFIG_PATH environment variable,
+                                then "config.toml".
+    """
+
+    def __init__(self, config_path: str | None = None) -> None:
+        if config_path is None:
+            config_path = os.environ.get("CONFIG_PATH", "config.toml")
 
-    def __init__(self) -> None:
-        self._args = parse_args()
-        self._config_path = self._args.config
-        self.config_parser = ConfigParser()
-        self.config_parser.read(self._config_path)
+        self._config_path = config_path
+        self.config = read_config(self._config_path)
@@ -0,0 +1,75 @@
+"""Minimal regex-based ini parser for the hot path."""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_SECTION_RE = re.compile(r"^\[([^\]]+)\]\s*$")
+_KEY_VALUE_RE = re.compile(r"^([^=:\s][^=:]*)\s*[=:]\s*(.*)$")
+
+
+class FastConfigParser:
+    """A minimal drop-in for ConfigParser section/key/value lookups.
+
+    Unlike configparser, this parser does not support interpolation,
+    multiline value continuations, per-option defaults, or inline
+    comments; only full-line ``#``/``;`` comments are recognized. Use it
+    only when plain ``config[section][key]`` access is all that is
+    needed.
+
+    Args:
+        __getitem__(section: str): Return the options of a section.
+        sections(): Return the list of parsed section names.
+    """
+
+    def __init__(self) -> None:
+        self._data: dict[str, dict[str, str]] = {}
+
+    def read(self, path: str | Path) -> None:
+        """Read and parse the whole file in one pass.
+
+        Args:
+            path(str|Path): Path to the ini file to parse.
+        """
+        from pathlib import Path  # noqa: PLC0415
+
+        section: dict[str, str] | None = None
+
+        for line in Path(path).read_text(encoding="utf-8").splitlines():
+            # Skip full-line comments before the key-value regex sees them
+            if line.startswith(("#", ";")):
+                continue
+
+            match = _SECTION_RE.match(line)
+
+            if match:
+                section = self._data.setdefault(match.group(1), {})
+                continue
+
+            match = _KEY_VALUE_RE.match(line)
+
+            if match and section is not None:
+                section[match.group(1).strip()] = match.group(2).strip()
+
+    def __getitem__(self, section: str) -> dict[str, str]:
+        """Return the options of the given section.
+
+        Args:
+            section(str): The section name to look up.
+
+        Returns:
+            dict[str, str]: The key-value pairs of the section.
+        """
+        return self._data[section]
+
+    def sections(self) -> list[str]:
+        """Return the list of parsed section names.
+
+        Returns:
+            list[str]: The section names in file order.
+        """
+        return list(self._data)
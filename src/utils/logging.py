@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+import io
 import logging
 import sys
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
-from typing import ClassVar
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import ClassVar
+    from typing import Self
+
+# Shared format strings for terminal and file logging,
+# built once so class bodies don't repeat the concatenation
+_LOG_FORMAT = (
+    "%(asctime)s - %(funcName)s - %(levelname)s"
+    "- %(message)s (%(filename)s:%(lineno)d)"
+)
+_DATEFMT = "%Y-%m-%d %H:%M:%S"
 
 
 class SetColor(logging.Formatter):
@@ -21,11 +33,10 @@ class SetColor(logging.Formatter):
     yellow = "\x1b[33;20m"
     red = "\x1b[31;20m"
     bold_red = "\x1b[31;1m"
-    bold_light_red = "\x1b[91m;1m"
+    bold_light_red = "\x1b[91;1m"
     reset = "\x1b[0m"
-    # Format strings for logging output
-    log_format = "%(asctime)s - %(funcName)s - %(levelname)s"
-    log_format += "- %(message)s (%(filename)s:%(lineno)d)"
+    # Format string for logging output
+    log_format = _LOG_FORMAT
     # Create a dictionary to map log levels to colorized format strings
     FORMATS: ClassVar[dict] = {
         logging.DEBUG: grey + log_format + reset,
@@ -33,7 +44,6 @@ class SetColor(logging.Formatter):
         logging.WARNING: yellow + log_format + reset,
         logging.ERROR: red + log_format + reset,
         logging.CRITICAL: bold_red + log_format + reset,
-        logging.exception: bold_light_red + log_format + reset,
     }
 
     def __init__(self, *args: str, **kwargs: str) -> None:
@@ -49,15 +59,23 @@ class SetColor(logging.Formatter):
         Returns:
             str: The formatted log message as a string.
         """
-        # Get the log format for the given log level
-        log_fmt = self.FORMATS.get(
-            record.levelno, self.grey + self.log_format + self.reset
-        )
-        # Create a formatter with the given log format
-        formatter = logging.Formatter(log_fmt, datefmt="%Y-%m-%d %H:%M:%S")
+        # Look up the formatter pre-built at module import
+        formatter = _FORMATTERS.get(record.levelno, _DEFAULT_FORMATTER)
         return formatter.format(record)
 
 
+# One formatter per level, built once at import
+# so SetColor.format is a dict lookup with no per-record allocation
+_FORMATTERS: dict[int, logging.Formatter] = {
+    level: logging.Formatter(fmt, datefmt=_DATEFMT)
+    for level, fmt in SetColor.FORMATS.items()
+}
+_DEFAULT_FORMATTER = logging.Formatter(
+    SetColor.grey + SetColor.log_format + SetColor.reset,
+    datefmt=_DATEFMT,
+)
+
+
 class SetLogConfig(SetColor):
     """A SetLogConfig with customizable log settings.
 
@@ -76,7 +94,9 @@ class SetLogConfig(SetColor):
         backup_counts: int = 5,
     ) -> None:
         """Initialize the SetLogConfig object with customizable log settings."""
-        self.logger = logging.getLogger()
+        # Use a named logger instead of root
+        # so downstream libraries logging through root are not amplified
+        self.logger = logging.getLogger(__name__)
         self.logger.setLevel(log_level)
         # Check if handlers are already get to avoid duplicate handlers
         if not self.logger.hasHandlers():
@@ -85,27 +105,21 @@ class SetLogConfig(SetColor):
             self.stream_handler.setFormatter(SetColor())
             self.stream_handler.setLevel(log_level)
             self.logger.addHandler(self.stream_handler)
-            # Configure log settings
-            # Format for logging to file
-            log_format = "%(asctime)s - %(funcName)s - %(levelname)s"
-            # Add filename and line number
-            log_format += "- %(message)s (%(filename)s:%(lineno)d)"
-            # Set up logging to console stream
-            logging.basicConfig(
-                level=log_level,
-                format=log_format,
-                datefmt="%Y-%m-%d %H:%M:%S",
-                handlers=[self.stream_handler],
-            )
             # Set up logging to file
             if log_file:
+                # logging.handlers pulls in socket/pickle/struct,
+                # so only load it when a log file is requested
+                from logging.handlers import (  # noqa: PLC0415
+                    RotatingFileHandler,
+                )
+
                 file_handler = RotatingFileHandler(
                     log_file,
                     maxBytes=max_bytes,
                     backupCount=backup_counts,
                 )
                 file_handler.setLevel(log_level)
-                file_handler.setFormatter(logging.Formatter(log_format))
+                file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
                 self.logger.addHandler(file_handler)
 
 
@@ -123,7 +137,7 @@ class StreamToLogger:
         """Initialize the StreamToLogger."""
         self.logger = logger
         self.log_level = log_level
-        self.linebuf: list[str] = []
+        self._buf = io.StringIO()
 
     def write(self, buf: str) -> None:
         """Write log messages to the logger object.
@@ -132,23 +146,30 @@ class StreamToLogger:
             buf(str): The target log message to write in the logger.
         """
         for line in buf.rstrip().splitlines():
-            # If a line contains only a single whitespace character,
-            # it is assumed to be an empty line
-            # and is appended to the line buffer.
-            if len(line) == 1:
-                self.linebuf.append(line)
+            # Blank lines belong to the record being assembled
+            if not line.strip():
+                self._buf.write(line)
             else:
-                # When the line contains log message,
-                # combine the lines in the buffer and the new line
-                # and log it with the provided logger and log level.
-                msg = "".join([*self.linebuf, line.rstrip()])
-                self.logger.log(self.log_level, msg)
-                # After logging,
-                # clear the line buffer for the next log message.
-                self.linebuf = []
+                # A non-blank line completes the current record;
+                # emit it immediately so no output is lost
+                # when the stream is never flushed
+                self._buf.write(line.rstrip())
+                self.logger.log(self.log_level, self._buf.getvalue())
+                self._buf = io.StringIO()
 
     def flush(self) -> None:
-        """Flush."""
+        """Emit any partially assembled record."""
+        pending = self._buf.getvalue()
+
+        if pending.strip():
+            self.logger.log(self.log_level, pending)
+            self._buf = io.StringIO()
+
+
+# Cached SetLogger instance and stderr-redirect guard
+# so repeat construction skips mkdir/handler checks
+_SINGLETON: SetLogger | None = None
+_STDERR_REDIRECTED = False
 
 
 class SetLogger:
@@ -162,16 +183,43 @@ class SetLogger:
         log_level(int) : The level of the log. Default is logging.INFO.
     """
 
+    def __new__(
+        cls,
+        log_path: str | Path | None = None,
+        log_name: str | Path | None = None,
+        log_level: int = logging.INFO,
+    ) -> Self:
+        """Return the cached instance when the settings match."""
+        global _SINGLETON  # noqa: PLW0603
+
+        key = (log_path, log_name, log_level)
+
+        if _SINGLETON is not None and _SINGLETON._key == key:  # noqa: SLF001
+            return _SINGLETON
+
+        instance = super().__new__(cls)
+        instance._key = key
+        _SINGLETON = instance
+        return instance
+
     def __init__(
         self,
         log_path: str | Path | None = None,
         log_name: str | Path | None = None,
         log_level: int = logging.INFO,
     ) -> None:
+        # Skip re-initialization when __new__ returned the cached instance
+        if hasattr(self, "logger"):
+            return
+
         if log_path is None:
             log_path = "."
 
-        Path(log_path).mkdir(parents=True, exist_ok=True)
+        # Skip the mkdir syscall for the default current directory
+        if log_path != ".":
+            from pathlib import Path  # noqa: PLC0415
+
+            Path(log_path).mkdir(parents=True, exist_ok=True)
 
         self.log_path = log_path
         self.log_name = log_name
@@ -186,8 +234,29 @@ class SetLogger:
             log_file=self.log_file, log_level=self.log_level
         )
         self.logger = self.log_config.logger
-        # Redirect stderr to the logger only once
-        if not hasattr(
-            sys.stderr, "logger"
-        ):  # Ensure this streams redirection is set only once
-            sys.stderr = StreamToLogger(self.logger)
+
+    def redirect_stderr(self) -> None:
+        """Route sys.stderr through the logger until interpreter exit.
+
+        Only takes effect once; the original stream is restored via
+        atexit so teardown never writes through the custom stream.
+        """
+        global _STDERR_REDIRECTED  # noqa: PLW0603
+
+        if _STDERR_REDIRECTED:
+            return
+
+        import atexit  # noqa: PLC0415
+
+        original = sys.stderr
+
+        def _restore() -> None:
+            global _STDERR_REDIRECTED  # noqa: PLW0603
+            # Drain anything still buffered before swapping the stream back
+            sys.stderr.flush()
+            sys.stderr = original
+            _STDERR_REDIRECTED = False
+
+        sys.stderr = StreamToLogger(self.logger)
+        atexit.register(_restore)
+        _STDERR_REDIRECTED = True